@@ -375,11 +375,9 @@ class ParallelContext:
         self.check_sanity()
 
         pg_init = []
-        # LSG: init data parallel process group for compatibility with other parallel module such as zero
-        pg_init.append(dict(type=INITIALIZER_MAPPING['data']))
-
-        if self.pipeline_parallel_size > 1:
-            pg_init.append(dict(type=INITIALIZER_MAPPING['pipeline']))
+        # create the tensor parallel groups first: they are the most heavily
+        # used ones, so their lazy NCCL communicator setup can overlap with
+        # the creation of the remaining groups
         pg_init.append(dict(type=INITIALIZER_MAPPING['tensor']))
 
         # init specific tensor parallel group
@@ -393,6 +391,18 @@ class ParallelContext:
             # add this config to initialize later
             pg_init.append(dict(type=INITIALIZER_MAPPING[tensor_parallel_mode.lower()], **tensor_parallel_cfg))
 
+        # LSG: init data parallel process group for compatibility with other parallel module such as zero
+        pg_init.append(dict(type=INITIALIZER_MAPPING['data']))
+
+        if self.pipeline_parallel_size > 1:
+            pg_init.append(dict(type=INITIALIZER_MAPPING['pipeline']))
+
+        # let NCCL collectives run on a high-priority CUDA stream unless
+        # the user disables it in the config
+        from colossalai.context.process_group_initializer.process_group_initializer import set_high_priority_stream
+        set_high_priority_stream(self.config.get('high_priority_nccl', True)
+                                 and dist.get_backend() == 'nccl')
+
         # run initialization of different process groups
         for initializer_cfg in pg_init:
             cfg = initializer_cfg.copy()
@@ -425,12 +435,19 @@ class ParallelContext:
     def destroy(self):
         """Destroys the current distributed parallel environment.
         """
+        # parallel modes may share one process group, so only destroy
+        # each underlying group once
+        destroyed = set()
         for mode, group in self._groups.items():
-            if mode is not ParallelMode.GLOBAL:
+            if mode is not ParallelMode.GLOBAL and id(group) not in destroyed:
+                destroyed.add(id(group))
                 dist.destroy_process_group(group)
         # destroy global process group
         dist.destroy_process_group()
 
+        from colossalai.context.process_group_initializer.process_group_initializer import clear_group_cache
+        clear_group_cache()
+
     def set_device(self, device_ordinal: int = None):
         """Sets distributed processes to be bound to devices.
 
@@ -443,6 +460,11 @@ class ParallelContext:
             device_ordinal = global_rank % devices_per_node
 
         torch.cuda.set_device(device_ordinal)
+
+        # the current device changed, drop the memoized result
+        from colossalai.utils.cuda import get_current_device
+        get_current_device.cache_clear()
+
         if self._verbose:
             self._logger.info(f'process rank {global_rank} is bound to device {device_ordinal}')
 
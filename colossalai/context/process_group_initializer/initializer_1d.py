@@ -5,7 +5,7 @@ import torch.distributed as dist
 
 from colossalai.context import Config
 from colossalai.registry import DIST_GROUP_INITIALIZER
-from .process_group_initializer import ProcessGroupInitializer
+from .process_group_initializer import ProcessGroupInitializer, get_process_group
 from ..parallel_mode import ParallelMode
 
 
@@ -32,7 +32,7 @@ class Initializer_1D(ProcessGroupInitializer):
 
         for i in range(self.num_group):
             ranks = [i * self.tensor_parallel_size + j for j in range(self.tensor_parallel_size)]
-            group = dist.new_group(ranks)
+            group = get_process_group(ranks)
 
             if self.rank in ranks:
                 local_rank = ranks.index(self.rank)
@@ -5,7 +5,7 @@ import torch.distributed as dist
 
 from colossalai.constants import SUMMA_DIM
 from colossalai.registry import DIST_GROUP_INITIALIZER
-from .process_group_initializer import ProcessGroupInitializer
+from .process_group_initializer import ProcessGroupInitializer, get_process_group
 from ..parallel_mode import ParallelMode
 
 
@@ -46,7 +46,7 @@ class Initializer_2D_Row(ProcessGroupInitializer):
             for j in range(self.summa_dim):
                 ranks = [i * self.tensor_parallel_size + j * self.summa_dim + k
                          for k in range(self.summa_dim)]
-                group = dist.new_group(ranks)
+                group = get_process_group(ranks)
 
                 if self.rank in ranks:
                     local_rank = ranks.index(self.rank)
@@ -82,7 +82,7 @@ class Initializer_2D_Col(ProcessGroupInitializer):
             for j in range(self.summa_dim):
                 ranks = [i * self.tensor_parallel_size + j + k * self.summa_dim
                          for k in range(self.summa_dim)]
-                group = dist.new_group(ranks)
+                group = get_process_group(ranks)
 
                 if self.rank in ranks:
                     local_rank = ranks.index(self.rank)
@@ -9,7 +9,7 @@ import torch.distributed as dist
 from colossalai.constants import TESSERACT_DIM, TESSERACT_DEP
 from colossalai.context import Config
 from colossalai.registry import DIST_GROUP_INITIALIZER
-from .process_group_initializer import ProcessGroupInitializer
+from .process_group_initializer import ProcessGroupInitializer, get_process_group
 from ..parallel_mode import ParallelMode
 
 
@@ -64,7 +64,7 @@ class Initializer_2p5D_ROW(ProcessGroupInitializer):
                 for k in range(self.tesseract_dep):
                     ranks = [h * self.tensor_parallel_size + i + self.tesseract_dim * (
                         j + self.tesseract_dim * k) for i in range(self.tesseract_dim)]
-                    group = dist.new_group(ranks)
+                    group = get_process_group(ranks)
 
                     if self.rank in ranks:
                         local_rank = ranks.index(self.rank)
@@ -107,7 +107,7 @@ class Initializer_2p5D_Col(ProcessGroupInitializer):
                 for k in range(self.tesseract_dep):
                     ranks = [h * self.tensor_parallel_size + i + self.tesseract_dim * (
                         j + self.tesseract_dim * k) for j in range(self.tesseract_dim)]
-                    group = dist.new_group(ranks)
+                    group = get_process_group(ranks)
 
                     if self.rank in ranks:
                         local_rank = ranks.index(self.rank)
@@ -150,7 +150,7 @@ class Initializer_2p5D_Dep(ProcessGroupInitializer):
                 for j in range(self.tesseract_dim):
                     ranks = [h * self.tensor_parallel_size + i + self.tesseract_dim * (
                         j + self.tesseract_dim * k) for k in range(self.tesseract_dep)]
-                    group = dist.new_group(ranks)
+                    group = get_process_group(ranks)
 
                     if self.rank in ranks:
                         local_rank = ranks.index(self.rank)
@@ -194,7 +194,7 @@ class Initializer_2p5D_XZ(ProcessGroupInitializer):
                 ranks = [h * self.tensor_parallel_size + i + self.tesseract_dim * (
                     j + self.tesseract_dim * k) for k in range(self.tesseract_dep) for j in
                     range(self.tesseract_dim)]
-                group = dist.new_group(ranks)
+                group = get_process_group(ranks)
 
                 if self.rank in ranks:
                     local_rank = ranks.index(self.rank)
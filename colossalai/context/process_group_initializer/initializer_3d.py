@@ -9,7 +9,7 @@ from colossalai.constants import DEPTH_3D, INPUT_GROUP_3D, WEIGHT_GROUP_3D, OUTP
 from colossalai.registry import DIST_GROUP_INITIALIZER
 
 from ..parallel_mode import ParallelMode
-from .process_group_initializer import ProcessGroupInitializer
+from .process_group_initializer import ProcessGroupInitializer, get_process_group
 
 
 def _check_depth_env_var(depth):
@@ -52,7 +52,7 @@ class Initializer_3D_Input(ProcessGroupInitializer):
                         h * self.depth**3 + i + self.depth *
                         (j + self.depth * k) for j in range(self.depth)
                     ]
-                    group = dist.new_group(ranks)
+                    group = get_process_group(ranks)
 
                     if self.rank in ranks:
                         local_rank = ranks.index(self.rank)
@@ -92,7 +92,7 @@ class Initializer_3D_Weight(ProcessGroupInitializer):
                         h * self.depth**3 + i + self.depth *
                         (j + self.depth * k) for i in range(self.depth)
                     ]
-                    group = dist.new_group(ranks)
+                    group = get_process_group(ranks)
 
                     if self.rank in ranks:
                         local_rank = ranks.index(self.rank)
@@ -132,7 +132,7 @@ class Initializer_3D_Output(ProcessGroupInitializer):
                         h * self.depth**3 + i + self.depth *
                         (j + self.depth * k) for k in range(self.depth)
                     ]
-                    group = dist.new_group(ranks)
+                    group = get_process_group(ranks)
 
                     if self.rank in ranks:
                         local_rank = ranks.index(self.rank)
@@ -4,7 +4,7 @@
 from torch import distributed as dist
 
 from colossalai.registry import DIST_GROUP_INITIALIZER
-from .process_group_initializer import ProcessGroupInitializer
+from .process_group_initializer import ProcessGroupInitializer, get_process_group
 from ..parallel_mode import ParallelMode
 
 
@@ -30,7 +30,7 @@ class Initializer_Data(ProcessGroupInitializer):
 
         for i in range(self.num_data_parallel_group):
             ranks = [i + j * self.num_data_parallel_group for j in range(self.data_parallel_size)]
-            group = dist.new_group(ranks)
+            group = get_process_group(ranks)
 
             if self.rank in ranks:
                 local_rank = ranks.index(self.rank)
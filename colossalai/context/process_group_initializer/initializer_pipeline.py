@@ -4,7 +4,7 @@
 from torch import distributed as dist
 
 from colossalai.registry import DIST_GROUP_INITIALIZER
-from .process_group_initializer import ProcessGroupInitializer
+from .process_group_initializer import ProcessGroupInitializer, get_process_group
 from ..parallel_mode import ParallelMode
 
 
@@ -24,7 +24,7 @@ class Initializer_Pipeline(ProcessGroupInitializer):
                           (i + 1) * self.data_group_size,
                           self.pipeline_stage_size))
                 pipe_group_size = len(pipe_ranks)
-                pipe_group = dist.new_group(pipe_ranks)
+                pipe_group = get_process_group(pipe_ranks)
 
                 if self.rank in pipe_ranks:
                     local_rank = pipe_ranks.index(self.rank)
@@ -40,7 +40,7 @@ class Initializer_Pipeline(ProcessGroupInitializer):
                     first = pipe_ranks[k]
                     second = pipe_ranks[(k + 1) % pipe_group_size]
                     ranks = [first, second]
-                    group = dist.new_group(ranks)
+                    group = get_process_group(ranks)
                     if self.rank == first:
                         local_rank = 0
                         group_world_size = 2
@@ -1,10 +1,72 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+import inspect
 from abc import ABC, abstractmethod
 
+from torch import distributed as dist
+
 from colossalai.context import Config
 
+# cache of created process groups keyed by their rank tuple, so that
+# initializers asking for an identical set of ranks share one group
+_GROUP_CACHE = dict()
+
+# whether newly created NCCL groups should run their collectives on a
+# high-priority CUDA stream
+_HIGH_PRIORITY_STREAM = False
+
+# new_group only accepts pg_options from torch 1.9 on
+_NEW_GROUP_ACCEPTS_PG_OPTIONS = 'pg_options' in inspect.signature(dist.new_group).parameters
+
+
+def set_high_priority_stream(enable: bool):
+    '''Makes subsequently created NCCL process groups launch their collectives
+    on a high-priority CUDA stream, which lowers the latency of small
+    collectives when compute kernels are already queued.
+
+    :param enable: whether to enable the high-priority stream
+    :type enable: bool
+    '''
+    global _HIGH_PRIORITY_STREAM
+    _HIGH_PRIORITY_STREAM = enable
+
+
+def _new_group(ranks):
+    if _HIGH_PRIORITY_STREAM and _NEW_GROUP_ACCEPTS_PG_OPTIONS \
+            and hasattr(dist, 'ProcessGroupNCCL'):
+        options = dist.ProcessGroupNCCL.Options()
+        options.is_high_priority_stream = True
+        return dist.new_group(ranks, pg_options=options)
+    return dist.new_group(ranks)
+
+
+def get_process_group(ranks):
+    '''Returns the process group for `ranks`, creating it on first request.
+
+    torch.distributed.new_group must be entered by every rank for every group,
+    so each duplicated group costs a full sweep over the world. Different
+    parallel modes frequently resolve to identical rank tuples (e.g. the data
+    parallel group and the tensor parallel group when one of the sizes is 1);
+    those are collapsed here.
+
+    :param ranks: global ranks forming the group
+    :type ranks: list
+    :return: the process group containing `ranks`
+    :rtype: torch.distributed.ProcessGroup
+    '''
+    key = tuple(ranks)
+    if key not in _GROUP_CACHE:
+        _GROUP_CACHE[key] = _new_group(ranks)
+    return _GROUP_CACHE[key]
+
+
+def clear_group_cache():
+    '''Clears the cached process groups, to be called when the distributed
+    environment is destroyed.
+    '''
+    _GROUP_CACHE.clear()
+
 
 class ProcessGroupInitializer(ABC):
     '''An object, knowing the parallelism configuration, that initializes parallel groups.
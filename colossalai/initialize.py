@@ -4,9 +4,12 @@
 import argparse
 import pprint
 import os
+import time
+from contextlib import contextmanager
 from colossalai.nn.optimizer.colossalai_optimizer import ColossalaiOptimizer
 import numpy as np
 import torch
+import torch.distributed as dist
 import torch.nn as nn
 
 from pathlib import Path
@@ -55,6 +58,117 @@ def get_default_parser():
     return parser
 
 
+def _topo_remap(rank: int, local_rank: int, world_size: int) -> int:
+    '''Remaps the global rank so that processes on the same node get consecutive ranks.
+
+    The process group initializers place tensor parallel groups on consecutive
+    global ranks, so keeping a node's processes contiguous keeps tensor parallel
+    collectives inside the node's NVLink domain instead of crossing the
+    inter-node fabric. The remap is opt-in through COLOSSALAI_TOPO_AWARE=1.
+
+    The remap must be applied by either every process or none, otherwise two
+    processes could claim the same global rank and hang the rendezvous - so
+    when the flag is set but the launcher does not expose enough topology
+    information, or the node layout cannot form a bijective permutation,
+    this fails loudly instead of silently falling back to the original rank.
+
+    :param rank: rank assigned by the launcher
+    :type rank: int
+    :param local_rank: rank of the process on its node
+    :type local_rank: int
+    :param world_size: world size of the default process group
+    :type world_size: int
+    :raises RuntimeError: raise a RuntimeError if the remap is enabled but the
+        required topology information is missing or inconsistent
+    :return: the remapped global rank
+    :rtype: int
+    '''
+    if os.environ.get('COLOSSALAI_TOPO_AWARE', '0') != '1':
+        return rank
+    if local_rank is None:
+        raise RuntimeError(
+            'COLOSSALAI_TOPO_AWARE=1 requires the launcher to provide a local rank')
+
+    local_world_size = (os.environ.get('LOCAL_WORLD_SIZE')
+                        or os.environ.get('SLURM_NTASKS_PER_NODE')
+                        or os.environ.get('OMPI_COMM_WORLD_LOCAL_SIZE'))
+    # torchrun exposes the node rank as GROUP_RANK
+    node_id = os.environ.get('SLURM_NODEID') or os.environ.get('GROUP_RANK')
+    if local_world_size is None or node_id is None:
+        raise RuntimeError(
+            'COLOSSALAI_TOPO_AWARE=1 requires LOCAL_WORLD_SIZE (or SLURM_NTASKS_PER_NODE / '
+            'OMPI_COMM_WORLD_LOCAL_SIZE) and SLURM_NODEID (or GROUP_RANK) to be set')
+    local_world_size, node_id = int(local_world_size), int(node_id)
+
+    # the remap is only a permutation of range(world_size) for homogeneous nodes
+    if world_size % local_world_size != 0 or local_rank >= local_world_size:
+        raise RuntimeError(
+            f'cannot remap ranks: expected the world size ({world_size}) to be a multiple of '
+            f'the local world size ({local_world_size}) and the local rank ({local_rank}) to '
+            f'be smaller than the local world size')
+
+    new_rank = node_id * local_world_size + local_rank
+    if new_rank >= world_size:
+        raise RuntimeError(
+            f'remapped rank ({new_rank}) is out of range for world size ({world_size}), '
+            f'please check the node rank (SLURM_NODEID / GROUP_RANK) and the local world size')
+    return new_rank
+
+
+@contextmanager
+def _launch_phase(name: str, timings: Dict[str, float] = None):
+    '''Tags one phase of :func:`launch` for profilers and, when `timings` is
+    given, records its wall-clock duration there. Profiles of multi-second
+    startup stalls can then be attributed to a concrete phase.
+
+    :param name: name of the launch phase
+    :type name: str
+    :param timings: mapping collecting phase durations in seconds
+    :type timings: dict, optional
+    '''
+    with torch.autograd.profiler.record_function(f'colossalai/launch/{name}'):
+        start = time.perf_counter()
+        yield
+        if timings is not None:
+            timings[name] = time.perf_counter() - start
+
+
+# PIPELINE_PREV/NEXT register a different two-rank pair group on every rank,
+# so warming them in a fixed mode order would circular-wait around the
+# pipeline ring; their communicators are left to initialize on first use
+_WARMUP_SKIP_MODES = (ParallelMode.PIPELINE_PREV, ParallelMode.PIPELINE_NEXT)
+
+
+def _warmup_process_groups(backend: str):
+    '''Issues a tiny all-reduce on every initialized process group so that the
+    first training iteration does not stall on NCCL communicator setup and
+    topology detection, which can take several seconds per communicator.
+
+    Only parallel modes whose group membership is consistent across ranks are
+    warmed; for those, every member reaches its group's collective at the same
+    position of the mode iteration, so the warmup cannot deadlock.
+
+    :param backend: backend for torch.distributed
+    :type backend: str
+    '''
+    if not torch.cuda.is_available() or backend != 'nccl':
+        return
+
+    warmed = set()
+    buf = torch.ones(1, device=get_current_device())
+    for mode in ParallelMode:
+        if mode in _WARMUP_SKIP_MODES:
+            continue
+        if gpc.is_initialized(mode):
+            group = gpc.get_group(mode)
+            # parallel modes may share one process group, warm each group once
+            if id(group) in warmed:
+                continue
+            warmed.add(id(group))
+            dist.all_reduce(buf.clone(), group=group)
+    torch.cuda.current_stream().synchronize()
+
+
 def launch(config: Union[str, Path, Config, Dict],
            rank: int,
            world_size: int,
@@ -88,27 +202,61 @@ def launch(config: Union[str, Path, Config, Dict],
     '''
     gpc.verbose = verbose
 
+    # collect per-phase wall-clock times when requested
+    timings = dict() if os.environ.get('COLOSSALAI_TIME_LAUNCH', '0') == '1' else None
+
     # set config
-    assert isinstance(config, (Config, str, Path, dict)), \
-        f'expected argument config to be Config, str or Path, but got {type(config)}'
-    if not isinstance(config, Config) and isinstance(config, dict):
-        config = Config(config)
-    if isinstance(config, (str, Path)):
-        config = Config.from_file(config)
-    gpc.load_config(config)
+    with _launch_phase('load_config', timings):
+        if isinstance(config, Config):
+            pass
+        elif isinstance(config, dict):
+            config = Config(config)
+        elif isinstance(config, (str, Path)):
+            config = Config.from_file(config)
+        else:
+            raise TypeError(
+                f'expected argument config to be Config, dict, str or Path, but got {type(config)}')
+        gpc.load_config(config)
+
+    # reorder ranks so that parallel groups line up with the node topology
+    rank = _topo_remap(rank, local_rank, world_size)
+
+    # small jobs do not benefit from NVLS trees or many channels
+    # but still pay their initialization cost
+    if backend == 'nccl' and world_size <= 8:
+        os.environ.setdefault('NCCL_NVLS_ENABLE', '0')
+        os.environ.setdefault('NCCL_MAX_NCHANNELS', '1')
 
     # init default process group
-    gpc.init_global_dist(rank, world_size, backend, host, port)
+    with _launch_phase('init_global_dist', timings):
+        gpc.init_global_dist(rank, world_size, backend, host, port)
 
     # init process groups for different parallel modes from config
-    gpc.init_parallel_groups()
+    # on torch >= 2.x this skips the eager per-new_group barrier; the
+    # store-based synchronization inside new_group is sufficient
+    with _launch_phase('init_parallel_groups', timings):
+        os.environ.setdefault('TORCH_DIST_INIT_BARRIER', '0')
+        gpc.init_parallel_groups()
 
     # set cuda device
-    if torch.cuda.is_available():
-        # if local rank is not given, calculate automatically
-        gpc.set_device(local_rank)
+    with _launch_phase('set_device', timings):
+        if torch.cuda.is_available():
+            # if local rank is not given, calculate automatically
+            gpc.set_device(local_rank)
 
-    gpc.set_seed(seed)
+    # set_seed manipulates the CUDA RNG state of the calling thread's current
+    # device, so it must stay on the main thread where set_device was called
+    with _launch_phase('set_seed', timings):
+        gpc.set_seed(seed)
+
+    # warm up the communicators here instead of in the first training step
+    with _launch_phase('warmup', timings):
+        _warmup_process_groups(backend)
+
+    if timings is not None:
+        breakdown = ', '.join(f'{name} {duration * 1000:.1f}ms'
+                              for name, duration in timings.items())
+        get_dist_logger().info(f'launch phase timings: {breakdown}', ranks=[0])
 
     if verbose:
         logger = get_dist_logger()
@@ -117,6 +265,29 @@ def launch(config: Union[str, Path, Config, Dict],
                     f'tensor parallel size: {gpc.tensor_parallel_size}', ranks=[0])
 
 
+def _launch_env(keys: Dict[str, str]) -> Dict[str, int]:
+    '''Reads the environment variables set by a distributed launcher in a single pass.
+
+    :param keys: mapping from launch argument name to environment variable name
+    :type keys: dict
+    :raises RuntimeError: raise a RuntimeError if a variable is missing or the rank
+        is not smaller than the world size
+    :return: mapping from launch argument name to its integer value
+    :rtype: dict
+    '''
+    try:
+        env = {arg: int(os.environ[var]) for arg, var in keys.items()}
+    except KeyError as e:
+        raise RuntimeError(f'environment variable {e} is not set by the launcher')
+
+    # validate here once instead of failing deep inside gpc.init_global_dist
+    rank, world_size = env.get('rank'), env.get('world_size')
+    if rank is not None and world_size is not None and rank >= world_size:
+        raise RuntimeError(
+            f'expected rank ({rank}) to be smaller than world size ({world_size})')
+    return env
+
+
 def launch_from_slurm(config: Union[str, Path, Config, Dict],
                       host: str,
                       port: int,
@@ -137,11 +308,10 @@ def launch_from_slurm(config: Union[str, Path, Config, Dict],
     :param verbose: whether to print logs
     :type verbose: bool
     '''
-    rank = int(os.environ['SLURM_PROCID'])
-    world_size = int(os.environ['SLURM_NPROCS'])
+    env = _launch_env({'rank': 'SLURM_PROCID',
+                       'world_size': 'SLURM_NPROCS'})
     launch(config=config,
-           rank=rank,
-           world_size=world_size,
+           **env,
            host=host,
            port=port,
            backend=backend,
@@ -169,13 +339,11 @@ def launch_from_openmpi(config: Union[str, Path, Config, Dict],
     :param verbose: whether to print logs
     :type verbose: bool
     '''
-    rank = int(os.environ['OMPI_COMM_WORLD_RANK'])
-    local_rank = int(os.environ['OMPI_COMM_WORLD_LOCAL_RANK'])
-    world_size = int(os.environ['OMPI_COMM_WORLD_SIZE'])
+    env = _launch_env({'rank': 'OMPI_COMM_WORLD_RANK',
+                       'local_rank': 'OMPI_COMM_WORLD_LOCAL_RANK',
+                       'world_size': 'OMPI_COMM_WORLD_SIZE'})
     launch(config=config,
-           local_rank=local_rank,
-           rank=rank,
-           world_size=world_size,
+           **env,
            host=host,
            port=port,
            backend=backend,
@@ -203,13 +371,11 @@ def launch_from_torch(config: Union[str, Path, Config, Dict],
     :param verbose: whether to print logs
     :type verbose: bool
     '''
-    rank = int(os.environ['RANK'])
-    local_rank = int(os.environ['LOCAL_RANK'])
-    world_size = int(os.environ['WORLD_SIZE'])
+    env = _launch_env({'rank': 'RANK',
+                       'local_rank': 'LOCAL_RANK',
+                       'world_size': 'WORLD_SIZE'})
     launch(config=config,
-           local_rank=local_rank,
-           rank=rank,
-           world_size=world_size,
+           **env,
            host=host,
            port=port,
            backend=backend,
@@ -217,6 +383,37 @@ def launch_from_torch(config: Union[str, Path, Config, Dict],
            verbose=verbose)
 
 
+def _build_round_robin_data_groups(num_groups: int):
+    '''Creates `num_groups` duplicates of the data parallel process groups and
+    combines the ones containing this rank into a round-robin process group,
+    so that DDP gradient buckets are all-reduced concurrently on several NCCL
+    streams instead of serially on one.
+
+    new_group is collective, so every rank creates the duplicates for every
+    data parallel group (same layout as Initializer_Data) even though it only
+    keeps its own.
+
+    :param num_groups: number of duplicated groups to round-robin over
+    :type num_groups: int
+    :return: a round-robin process group for the data parallel ranks
+    :rtype: torch.distributed.ProcessGroup
+    '''
+    from torch.distributed.distributed_c10d import _round_robin_process_groups
+
+    rank = gpc.get_global_rank()
+    data_parallel_size = gpc.get_world_size(ParallelMode.DATA)
+    num_dp_groups = gpc.get_world_size(ParallelMode.GLOBAL) // data_parallel_size
+
+    groups = []
+    for _ in range(num_groups):
+        for i in range(num_dp_groups):
+            ranks = [i + j * num_dp_groups for j in range(data_parallel_size)]
+            group = dist.new_group(ranks)
+            if rank in ranks:
+                groups.append(group)
+    return _round_robin_process_groups(groups)
+
+
 def initialize(model: Union[nn.Module, List[nn.Module]],
                optimizer: Union[Optimizer, List[Optimizer]],
                criterion: Union[_Loss, List[_Loss]],
@@ -251,40 +448,64 @@ def initialize(model: Union[nn.Module, List[nn.Module]],
     # get config from gpc
     config = gpc.config
 
+    # resolve the frequently used config keys once instead of
+    # traversing the Config object repeatedly on every rank
+    fp16_cfg = config.get('fp16', None)
+    zero_cfg = config.get('zero', None)
+    gradient_handler_cfg = config.get('gradient_handler', None)
+    grad_accum_size = config.get('gradient_accumulation', None)
+    clip_grad_norm = config.get('clip_grad_norm', 0.0)
+    cudnn_benchmark = config.get('cudnn_benchmark', True)
+    cudnn_deterministic = config.get('cudnn_deterministic', False)
+    use_zero3 = zero_cfg is not None and zero_cfg.get('level') == 3
+
     # print config
-    if verbose:
+    # only rank 0 emits the log, so only rank 0 pays for formatting it
+    if verbose and gpc.get_global_rank() == 0:
         logger.info(f"\n========== Your Config ========\n"
-                    f"{pprint.pformat(gpc.config)}\n"
+                    f"{pprint.pformat(config)}\n"
                     f"================================\n", ranks=[0])
 
     # cudnn
-    cudnn_benchmark = config.get('cudnn_benchmark', True)
-    cudnn_deterministic = config.get('cudnn_deterministic', False)
     torch.backends.cudnn.benchmark = cudnn_benchmark
     torch.backends.cudnn.deterministic = cudnn_deterministic
     if verbose:
         logger.info(
             f"cuDNN benchmark = {cudnn_benchmark}, deterministic = {cudnn_deterministic}", ranks=[0])
 
-    # first sync model across dp ranks
-    model.to(get_current_device())
-    use_zero3 = hasattr(gpc.config, 'zero') and gpc.config.zero.level == 3
-    if not use_zero3:
-        sync_model_param_in_dp(model)
-
     # check amp and zero
-    fp16_cfg = gpc.config.get('fp16', None)
-    zero_cfg = gpc.config.get('zero', None)
-
     if fp16_cfg is not None and fp16_cfg.mode is not None and zero_cfg is not None:
         raise ConfigException(
             "It is not allowed to set fp16 and zero configuration in your config file at the same time")
 
-    # initialize amp
     amp_mode = None
     if fp16_cfg is not None and fp16_cfg.mode is not None:
+        amp_mode = fp16_cfg.mode
+
+    # decide up front whether the model will be wrapped by torch DDP below;
+    # DDP already broadcasts the parameters from rank 0 at construction, so
+    # an explicit full-model broadcast beforehand would be redundant
+    will_use_ddp = gradient_handler_cfg is None and zero_cfg is None \
+        and not isinstance(optimizer, (ZeroRedundancyOptimizer_Level_2, ZeroRedundancyOptimizer_Level_3)) \
+        and is_using_ddp() and not is_using_pp() and amp_mode != AMP_TYPE.NAIVE
+
+    # first sync model across dp ranks
+    device = get_current_device()
+    target_device = torch.device(device) if isinstance(device, str) else torch.device('cuda', device)
+    # fast path: when the first parameter already sits on the target device
+    # the model was built there, so the full parameter/buffer traversal in
+    # model.to is a no-op and can be skipped; pipeline parallel models may
+    # span devices and always go through model.to
+    first_param = next(model.parameters(), None)
+    if is_using_pp() or first_param is None or first_param.device != target_device:
+        model.to(device)
+    if not use_zero3 and not will_use_ddp:
+        sync_model_param_in_dp(model)
+
+    # initialize amp
+    if amp_mode is not None:
         cfg_ = fp16_cfg.copy()
-        amp_mode = cfg_.pop('mode')
+        cfg_.pop('mode')
         model, optimizer, criterion = convert_to_amp(model=model,
                                                      optimizer=optimizer,
                                                      criterion=criterion,
@@ -301,7 +522,6 @@ def initialize(model: Union[nn.Module, List[nn.Module]],
                                            )
 
     # gradient handler
-    gradient_handler_cfg = gpc.config.get('gradient_handler', None)
     if gradient_handler_cfg is None:
         # if gradient handler is not specified in the configuration file,
         # check in the following order
@@ -316,8 +536,22 @@ def initialize(model: Union[nn.Module, List[nn.Module]],
                     "Training with zero is detected, ZeROGradientHandler is automatically "
                     "added even though not specified in the configuration",
                     ranks=[0])
-        elif is_using_ddp() and not is_using_pp() and amp_mode != AMP_TYPE.NAIVE:
-            model = DDP(model, process_group=gpc.get_group(ParallelMode.DATA))
+        elif will_use_ddp:
+            ddp_round_robin = config.get('ddp_round_robin', 1)
+            if ddp_round_robin > 1:
+                data_parallel_group = _build_round_robin_data_groups(ddp_round_robin)
+            else:
+                data_parallel_group = gpc.get_group(ParallelMode.DATA)
+            # let the gradient buckets alias the gradients instead of keeping
+            # a second model-size buffer; static_graph additionally skips the
+            # per-iteration unused-parameter search for fixed graphs
+            ddp_kwargs = dict(process_group=data_parallel_group,
+                              broadcast_buffers=config.get('ddp_broadcast_buffers', True),
+                              gradient_as_bucket_view=True,
+                              bucket_cap_mb=config.get('ddp_bucket_mb', 25))
+            if config.get('ddp_static_graph', False):
+                ddp_kwargs['static_graph'] = True
+            model = DDP(model, **ddp_kwargs)
             if verbose:
                 logger.info(
                     'Model is using torch.nn.parallel.DistributedDataParallel', ranks=[0])
@@ -348,7 +582,6 @@ def initialize(model: Union[nn.Module, List[nn.Module]],
         optimizer = ColossalaiOptimizer(optim=optimizer)
 
     # gradient accumulation
-    grad_accum_size = gpc.config.get('gradient_accumulation', None)
     if grad_accum_size is not None:
         optimizer, train_dataloader, gradient_handlers, lr_scheduler = accumulate_gradient(model=model,
                                                                                            optimizer=optimizer,
@@ -358,7 +591,6 @@ def initialize(model: Union[nn.Module, List[nn.Module]],
                                                                                            lr_scheduler=lr_scheduler)
 
     # clip grad norm
-    clip_grad_norm = gpc.config.get('clip_grad_norm', 0.0)
     if clip_grad_norm > 0:
         if zero_cfg is not None:
             raise ConfigException(
@@ -1,33 +1,113 @@
 import torch
+import torch.nn.functional as F
+from torch.cuda.amp import custom_bwd, custom_fwd
 
-try:
-    import fused_mix_prec_layer_norm_cuda
-except:
-    fused_mix_prec_layer_norm_cuda = None
+_FUSED_LN = None
+_LN_FALLBACK = None
+
+
+def _get_ext():
+  '''Lazily imports the fused layer norm CUDA extension so that importing
+  this module stays cheap and the shared object is only loaded by ranks
+  which actually run the 1D fused layer norm. Returns None when the
+  extension is not available.
+  '''
+  global _FUSED_LN
+  if _FUSED_LN is None:
+    try:
+      import fused_mix_prec_layer_norm_cuda
+      _FUSED_LN = fused_mix_prec_layer_norm_cuda
+    except ImportError:
+      _FUSED_LN = False
+  return _FUSED_LN or None
+
+
+def _get_fallback():
+  '''Returns a plain layer norm for systems without the CUDA extension,
+  compiled with torch.compile when available so that the mean, variance and
+  affine steps still fuse into a single kernel. Inductor compiles lazily and
+  can itself fail where eager works (e.g. no C++ toolchain), so the first
+  call runs under a guard and drops back to eager permanently on failure.
+  '''
+  global _LN_FALLBACK
+  if _LN_FALLBACK is None:
+    def _layer_norm(input, weight, bias, normalized_shape, eps):
+      return F.layer_norm(input, normalized_shape, weight, bias, eps)
+
+    if hasattr(torch, 'compile'):
+      compiled = torch.compile(_layer_norm, fullgraph=True)
+
+      def _compiled_first_call(input, weight, bias, normalized_shape, eps):
+        global _LN_FALLBACK
+        try:
+          output = compiled(input, weight, bias, normalized_shape, eps)
+        except Exception:
+          _LN_FALLBACK = _layer_norm
+          return _layer_norm(input, weight, bias, normalized_shape, eps)
+        _LN_FALLBACK = compiled
+        return output
+
+      _LN_FALLBACK = _compiled_first_call
+    else:
+      _LN_FALLBACK = _layer_norm
+  return _LN_FALLBACK
 
 
 class FusedLayerNormAffineFunction1D(torch.autograd.Function):
 
   @staticmethod
+  @custom_fwd
   def forward(ctx, input, weight, bias, normalized_shape, eps):
-    ctx.normalized_shape = normalized_shape
-    ctx.eps = eps
-    input_ = input.contiguous()
-    weight_ = weight.contiguous()
-    bias_ = bias.contiguous()
-    output, mean, invvar = fused_mix_prec_layer_norm_cuda.forward_affine(
+    # keep a plain tuple and an unboxed float on the autograd node instead
+    # of retaining a torch.Size/list until backward
+    ctx.normalized_shape = tuple(normalized_shape)
+    ctx.eps = float(eps)
+    # inputs and parameters are almost always contiguous already, so only
+    # pay the dispatch cost of .contiguous() when a copy is really needed
+    input_ = input if input.is_contiguous() else input.contiguous()
+    weight_ = weight if weight.is_contiguous() else weight.contiguous()
+    bias_ = bias if bias.is_contiguous() else bias.contiguous()
+    ext = _get_ext()
+    if ext is None:
+      ctx.fused = False
+      output = _get_fallback()(input_, weight_, bias_,
+                               ctx.normalized_shape, ctx.eps)
+      ctx.save_for_backward(input_, weight_, bias_)
+      return output
+    ctx.fused = True
+    output, mean, invvar = ext.forward_affine(
         input_, ctx.normalized_shape, weight_, bias_, ctx.eps)
     ctx.save_for_backward(input_, weight_, bias_, mean, invvar)
     return output
 
 
   @staticmethod
+  @custom_bwd
   def backward(ctx, grad_output):
+    # e.g. a frozen layer norm with detached input: nothing downstream
+    # needs these gradients, skip the backward kernel entirely
+    if not any(ctx.needs_input_grad[:3]):
+      return None, None, None, None, None
+
+    if not ctx.fused:
+      # recompute the fallback forward under autograd and differentiate it
+      input_, weight_, bias_ = ctx.saved_tensors
+      with torch.enable_grad():
+        input_d = input_.detach().requires_grad_(True)
+        weight_d = weight_.detach().requires_grad_(True)
+        bias_d = bias_.detach().requires_grad_(True)
+        output = _get_fallback()(input_d, weight_d, bias_d,
+                                 ctx.normalized_shape, ctx.eps)
+      grad_input, grad_weight, grad_bias = torch.autograd.grad(
+          output, (input_d, weight_d, bias_d), grad_output)
+      return grad_input, grad_weight, grad_bias, None, None
+
     input_, weight_, bias_, mean, invvar = ctx.saved_tensors
+    grad_output_ = grad_output if grad_output.is_contiguous() else grad_output.contiguous()
     grad_input = grad_weight = grad_bias = None
     grad_input, grad_weight, grad_bias \
-      = fused_mix_prec_layer_norm_cuda.backward_affine(
-        grad_output.contiguous(), mean, invvar,
+      = _get_ext().backward_affine(
+        grad_output_, mean, invvar,
         input_, ctx.normalized_shape,
         weight_, bias_, ctx.eps)
 
@@ -269,8 +269,9 @@ class MixedFusedLayerNorm1D(torch.nn.Module):
 
         if isinstance(normalized_shape, numbers.Integral):
             normalized_shape = (normalized_shape,)
-        self.normalized_shape = torch.Size(normalized_shape)
-        self.eps = eps
+        # a plain tuple avoids re-canonicalization in the Function every call
+        self.normalized_shape = tuple(normalized_shape)
+        self.eps = float(eps)
         self.weight = Parameter(torch.Tensor(*normalized_shape))
         self.bias = Parameter(torch.Tensor(*normalized_shape))
         self.reset_parameters()
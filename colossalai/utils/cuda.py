@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+import functools
+
 import torch
 
 
@@ -20,9 +22,14 @@ def set_to_cuda(models):
         return models.to(get_current_device())
 
 
+@functools.lru_cache(maxsize=1)
 def get_current_device():
     '''
     Returns the index of a currently selected device (gpu/cpu).
+
+    The result is cached to avoid a CUDA driver query per call; the bound
+    device only changes through :meth:`colossalai.context.ParallelContext.set_device`,
+    which clears this cache.
     '''
     if torch.cuda.is_available():
         return torch.cuda.current_device()
@@ -91,17 +91,21 @@ def zero3_model_context(dtype=torch.half):
     """
     assert dtype == torch.half or dtype == torch.float, f'Invalid dtype, except torch.half or torch.float, got {dtype}'
     import deepspeed
+    # Config is dict-backed, so dict-style get avoids the raise-and-catch
+    # AttributeError path that getattr with a default takes on missing keys
+    zero_cfg = gpc.config.zero
+    offload_param_cfg = zero_cfg.get('offload_param_config', None)
     ds_config = {
         "train_micro_batch_size_per_gpu": 1,
         "gradient_accumulation_steps": 1,
         "zero_optimization": {
-            "offload_param": getattr(gpc.config.zero, 'offload_param_config', None),
-            "offload_optimizer": getattr(gpc.config.zero, 'offload_optimizer_config'),
+            "offload_param": offload_param_cfg,
+            "offload_optimizer": zero_cfg.offload_optimizer_config,
         },
-        "aio": getattr(gpc.config.zero, 'aio_config', None)
+        "aio": zero_cfg.get('aio_config', None)
     }
-    remote_device = getattr(ds_config['zero_optimization']['offload_param'], 'device', None)
-    pin_memory = getattr(ds_config['zero_optimization']['offload_param'], 'pin_memory', False)
+    remote_device = offload_param_cfg.get('device', None) if offload_param_cfg is not None else None
+    pin_memory = offload_param_cfg.get('pin_memory', False) if offload_param_cfg is not None else False
     return deepspeed.zero.Init(data_parallel_group=gpc.get_group(ParallelMode.DATA),
                                remote_device=remote_device,
                                config_dict_or_path=ds_config,
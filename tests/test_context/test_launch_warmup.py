@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import pytest
+import torch
+import torch.multiprocessing as mp
+
+from colossalai import launch
+from colossalai.core import global_context as gpc
+from functools import partial
+
+CONFIG = dict(
+    parallel=dict(
+        pipeline=dict(size=2),
+        tensor=dict(size=2, mode='1d')
+    )
+)
+
+
+def run_launch(rank, world_size, backend, port, host):
+    dist_args = dict(
+        config=CONFIG,
+        rank=rank,
+        world_size=world_size,
+        backend=backend,
+        port=port,
+        host=host,
+        verbose=False
+    )
+    launch(**dist_args)
+
+    gpc.destroy()
+    torch.cuda.empty_cache()
+
+
+@pytest.mark.dist
+def test_launch_with_pipeline():
+    """
+    launch() warms up the NCCL communicators; with pipeline parallelism the
+    PIPELINE_PREV/NEXT pair groups differ per rank, so this guards against
+    the warmup deadlocking around the pipeline ring.
+    """
+    world_size = 4
+    test_fn = partial(run_launch,
+                      world_size=world_size,
+                      backend='nccl',
+                      port='29901',
+                      host='localhost'
+                      )
+    mp.spawn(test_fn, nprocs=world_size)
+
+
+if __name__ == '__main__':
+    test_launch_with_pipeline()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import pytest
+
+from colossalai.initialize import _launch_env, _topo_remap, launch
+
+
+@pytest.mark.cpu
+def test_launch_env_reads_variables(monkeypatch):
+    monkeypatch.setenv('RANK', '1')
+    monkeypatch.setenv('LOCAL_RANK', '1')
+    monkeypatch.setenv('WORLD_SIZE', '4')
+    env = _launch_env({'rank': 'RANK',
+                       'local_rank': 'LOCAL_RANK',
+                       'world_size': 'WORLD_SIZE'})
+    assert env == dict(rank=1, local_rank=1, world_size=4)
+
+
+@pytest.mark.cpu
+def test_launch_env_missing_variable(monkeypatch):
+    monkeypatch.delenv('RANK', raising=False)
+    monkeypatch.setenv('WORLD_SIZE', '4')
+    with pytest.raises(RuntimeError):
+        _launch_env({'rank': 'RANK', 'world_size': 'WORLD_SIZE'})
+
+
+@pytest.mark.cpu
+def test_launch_env_rank_out_of_range(monkeypatch):
+    monkeypatch.setenv('RANK', '4')
+    monkeypatch.setenv('WORLD_SIZE', '4')
+    with pytest.raises(RuntimeError):
+        _launch_env({'rank': 'RANK', 'world_size': 'WORLD_SIZE'})
+
+
+@pytest.mark.cpu
+def test_topo_remap_disabled_is_identity(monkeypatch):
+    monkeypatch.delenv('COLOSSALAI_TOPO_AWARE', raising=False)
+    assert _topo_remap(3, 1, 8) == 3
+
+
+@pytest.mark.cpu
+def test_topo_remap_reorders_cyclic_ranks(monkeypatch):
+    # two nodes with two processes each under a cyclic scheduler: the first
+    # process on node 1 should become global rank 2 so that consecutive
+    # global ranks stay on one node
+    monkeypatch.setenv('COLOSSALAI_TOPO_AWARE', '1')
+    monkeypatch.setenv('LOCAL_WORLD_SIZE', '2')
+    monkeypatch.setenv('SLURM_NODEID', '1')
+    assert _topo_remap(1, 0, 4) == 2
+    assert _topo_remap(3, 1, 4) == 3
+
+
+@pytest.mark.cpu
+def test_topo_remap_accepts_torchrun_group_rank(monkeypatch):
+    # without SLURM, torchrun exposes the node rank as GROUP_RANK
+    monkeypatch.setenv('COLOSSALAI_TOPO_AWARE', '1')
+    monkeypatch.setenv('LOCAL_WORLD_SIZE', '2')
+    monkeypatch.delenv('SLURM_NODEID', raising=False)
+    monkeypatch.setenv('GROUP_RANK', '1')
+    assert _topo_remap(1, 0, 4) == 2
+
+
+@pytest.mark.cpu
+def test_topo_remap_requires_topology_info(monkeypatch):
+    monkeypatch.setenv('COLOSSALAI_TOPO_AWARE', '1')
+    monkeypatch.delenv('LOCAL_WORLD_SIZE', raising=False)
+    monkeypatch.delenv('SLURM_NTASKS_PER_NODE', raising=False)
+    monkeypatch.delenv('OMPI_COMM_WORLD_LOCAL_SIZE', raising=False)
+    monkeypatch.setenv('SLURM_NODEID', '0')
+    with pytest.raises(RuntimeError):
+        _topo_remap(0, 0, 4)
+
+
+@pytest.mark.cpu
+def test_topo_remap_rejects_heterogeneous_nodes(monkeypatch):
+    monkeypatch.setenv('COLOSSALAI_TOPO_AWARE', '1')
+    monkeypatch.setenv('LOCAL_WORLD_SIZE', '3')
+    monkeypatch.setenv('SLURM_NODEID', '0')
+    with pytest.raises(RuntimeError):
+        _topo_remap(0, 0, 4)
+
+
+@pytest.mark.cpu
+def test_topo_remap_rejects_out_of_range_rank(monkeypatch):
+    monkeypatch.setenv('COLOSSALAI_TOPO_AWARE', '1')
+    monkeypatch.setenv('LOCAL_WORLD_SIZE', '2')
+    monkeypatch.setenv('SLURM_NODEID', '2')
+    with pytest.raises(RuntimeError):
+        _topo_remap(1, 0, 4)
+
+
+@pytest.mark.cpu
+def test_launch_rejects_invalid_config_type():
+    # the config is normalized before any process group is created, so an
+    # unsupported type must fail fast with a TypeError
+    with pytest.raises(TypeError):
+        launch(config=0,
+               rank=0,
+               world_size=1,
+               host='localhost',
+               port='29999')
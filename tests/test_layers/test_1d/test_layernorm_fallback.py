@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import pytest
+import torch
+
+from colossalai.nn.layer.parallel_1d import _operation
+
+
+@pytest.mark.cpu
+def test_layernorm_fallback_matches_torch():
+    """
+    Without the CUDA extension FusedLayerNormAffineFunction1D falls back to
+    F.layer_norm; its output and gradients must match torch.nn.LayerNorm.
+    """
+    if _operation._get_ext() is not None:
+        pytest.skip('fused_mix_prec_layer_norm_cuda is available, the fallback path is not taken')
+
+    torch.manual_seed(1024)
+    normalized_shape = (32,)
+    eps = 1e-5
+
+    input = torch.randn(4, 8, 32, requires_grad=True)
+    weight = torch.randn(32, requires_grad=True)
+    bias = torch.randn(32, requires_grad=True)
+
+    ref_input = input.detach().clone().requires_grad_(True)
+    ref_weight = weight.detach().clone().requires_grad_(True)
+    ref_bias = bias.detach().clone().requires_grad_(True)
+
+    out = _operation.FusedLayerNormAffineFunction1D.apply(
+        input, weight, bias, normalized_shape, eps)
+    ref_out = torch.nn.functional.layer_norm(
+        ref_input, normalized_shape, ref_weight, ref_bias, eps)
+    assert torch.allclose(out, ref_out, atol=1e-6)
+
+    grad_output = torch.randn_like(out)
+    out.backward(grad_output)
+    ref_out.backward(grad_output)
+    assert torch.allclose(input.grad, ref_input.grad, atol=1e-6)
+    assert torch.allclose(weight.grad, ref_weight.grad, atol=1e-6)
+    assert torch.allclose(bias.grad, ref_bias.grad, atol=1e-6)
+
+
+if __name__ == '__main__':
+    test_layernorm_fallback_matches_torch()